@@ -9,35 +9,43 @@ class Chario:
 
 	def __init__(self, sourceFileName):
 		"""
-		open an Ada source file(.txt extension)
+		open an Ada source file(.txt extension) and load its whole text
+		into a single lower case buffer, tracked by a cursor position
 		"""
-		self.sourceFile = open(sourceFileName, 'rb')
+		with open(sourceFileName, 'rb') as sourceFile:
+			self.buffer = sourceFile.read().decode(errors="replace").lower()
+		self.pos = 0
 
 
 	def GetNextChar(self):
 		"""
-		Read a single character and convert it to lower case
+		Read a single character from the buffer and advance the cursor
 		"""
-		escapeSequence = {b'\n' : "\n", b'\t' : "\t", b'\r' : "\r"}
-
-		raw = self.sourceFile.read(1)
-		if raw == b'':
+		if self.pos >= len(self.buffer):
 			return "EOF"
-		elif raw in escapeSequence:
-			return escapeSequence[raw]
-		else:
-			return str(raw)[2:3].lower()
+
+		char = self.buffer[self.pos]
+		self.pos += 1
+		return char
+
+
+	def ReadAll(self):
+		"""
+		Read all remaining characters at once
+		"""
+		rest = self.buffer[self.pos:]
+		self.pos = len(self.buffer)
+		return rest
 
 
 	def PeekNextChar(self):
 		"""
-		Read a single character without changing file pointer
+		Read a single character without moving the cursor
 		"""
-		rtn = self.GetNextChar()
-		if rtn != "EOF":
-			self.sourceFile.seek(-1, 1)
+		if self.pos >= len(self.buffer):
+			return "EOF"
 
-		return rtn
+		return self.buffer[self.pos]
 
 	def PrintErrorMessage(self, message):
 		"""
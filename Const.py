@@ -1,96 +1,93 @@
+import sys
+
+
 class Const:
 	"""
 	The Const class contains the reserved codes of the Token class.
 	"""
-	
+
+	# empty __slots__ so that subclasses (Token) declaring __slots__
+	# really do drop the per-instance __dict__
+	__slots__ = ()
+
+	# every code is interned so that comparing two codes short-circuits
+	# on object identity and set/dict lookups reuse the cached hash
+
 	# delimiter
-	BLANK =" "
-	NEWLINE ="\n"
-	TAB ="\t"
-	CR = "\r"
-	BACKSLASH = "\\"
-	COMMA = ","
-	COLON = ":"
-	SEMICOLON = ";"
-	DOT_DOT = ".."
-	PARENTHESIS_OPEN = "("
-	PARENTHESIS_CLOSE = ")"
-	COLON_EQ = ":="
+	BLANK = sys.intern(" ")
+	NEWLINE = sys.intern("\n")
+	TAB = sys.intern("\t")
+	CR = sys.intern("\r")
+	BACKSLASH = sys.intern("\\")
+	COMMA = sys.intern(",")
+	COLON = sys.intern(":")
+	SEMICOLON = sys.intern(";")
+	DOT_DOT = sys.intern("..")
+	PARENTHESIS_OPEN = sys.intern("(")
+	PARENTHESIS_CLOSE = sys.intern(")")
+	COLON_EQ = sys.intern(":=")
 
 	# reserved words
-	IS ="is"
-	BEGIN = "begin"
-	END = "end"
-	RANGE = "range"
-	ARRAY = "array"
-	OF = "of"
-	IN = "in"
-	OUT = "out"
-	THEN = "then"
-	ELSIF = "elsif"
-	ELSE = "else"
-	WHEN = "when"
-	CONSTANT = "constant"
-	TYPE = "type"
-	PROC = "procedure"
-	EXIT = "exit"
-	IF = "if"
-	LOOP = "loop"
-	NULL ="null"		# page 249
-	WHILE = "while"
+	IS = sys.intern("is")
+	BEGIN = sys.intern("begin")
+	END = sys.intern("end")
+	RANGE = sys.intern("range")
+	ARRAY = sys.intern("array")
+	OF = sys.intern("of")
+	IN = sys.intern("in")
+	OUT = sys.intern("out")
+	THEN = sys.intern("then")
+	ELSIF = sys.intern("elsif")
+	ELSE = sys.intern("else")
+	WHEN = sys.intern("when")
+	CONSTANT = sys.intern("constant")
+	TYPE = sys.intern("type")
+	PROC = sys.intern("procedure")
+	EXIT = sys.intern("exit")
+	IF = sys.intern("if")
+	LOOP = sys.intern("loop")
+	NULL = sys.intern("null")		# page 249
+	WHILE = sys.intern("while")
 
 	# operators
-	PLUS ="+"
-	MINUS ="-"
-	MUL ="*"
-	DIV = "/"
-	SQUARE ="**"
-	EQ ="=" 
-	NE ="/=" 
-	LT ="<" 
-	LE ="<=" 
-	GT =">" 
-	GE =">="
-	MOD ="mod"	# note
-	NOT ="not"
-	AND ="and"
-	OR ="or"
+	PLUS = sys.intern("+")
+	MINUS = sys.intern("-")
+	MUL = sys.intern("*")
+	DIV = sys.intern("/")
+	SQUARE = sys.intern("**")
+	EQ = sys.intern("=")
+	NE = sys.intern("/=")
+	LT = sys.intern("<")
+	LE = sys.intern("<=")
+	GT = sys.intern(">")
+	GE = sys.intern(">=")
+	MOD = sys.intern("mod")	# note
+	NOT = sys.intern("not")
+	AND = sys.intern("and")
+	OR = sys.intern("or")
 
 	# special codes
-	ID = "identifier"
-	numericalLiteral = "numericalLiteral"
-	stringLiteral = "stringLiteral"
-	EOF = "EOF"
-	UET = "unexpectedToken"
+	ID = sys.intern("identifier")
+	numericalLiteral = sys.intern("numericalLiteral")
+	stringLiteral = sys.intern("stringLiteral")
+	EOF = sys.intern("EOF")
+	UET = sys.intern("unexpectedToken")
 
-	basicDeclarationHandles = (ID, PROC, TYPE)
-	statementHandles = (EXIT, ID, IF, LOOP, NULL, WHILE)
-	relationalOperator = (EQ, NE, LT, LE, GT, GE,)
-	addingOperator = (PLUS, MINUS)
-	multiplyingOperator = (MUL, DIV, MOD)
+	# handle sets are only ever used for membership tests in the parser,
+	# so they are frozensets to make those tests O(1)
+	basicDeclarationHandles = frozenset((ID, PROC, TYPE))
+	statementHandles = frozenset((EXIT, ID, IF, LOOP, NULL, WHILE))
+	relationalOperator = frozenset((EQ, NE, LT, LE, GT, GE))
+	addingOperator = frozenset((PLUS, MINUS))
+	multiplyingOperator = frozenset((MUL, DIV, MOD))
 
-	reservedWords = (
-		IS, BEGIN, END, RANGE, ARRAY, OF, IN, OUT, 
-		THEN, ELSIF, ELSE, WHEN, CONSTANT, 
-		TYPE, PROC, 
-		EXIT, IF, LOOP, NULL, WHILE, 
+	# built once at class creation so the scanner's per-identifier
+	# reserved word check is a single O(1) set lookup
+	reservedWords = frozenset((
+		IS, BEGIN, END, RANGE, ARRAY, OF, IN, OUT,
+		THEN, ELSIF, ELSE, WHEN, CONSTANT,
+		TYPE, PROC,
+		EXIT, IF, LOOP, NULL, WHILE,
 		MOD, NOT, AND, OR
-	)
-
-
-# factorOperator = pd.Series({
-# 	"SQUARE": "**"
-# })
-# 
-
-# stringOperator = pd.Series({
-# 	"MOD": "mod",	# note
-# 	"NOT": "not",
-# 	"AND": "and",
-# 	"OR": "or"
-# })
-
-# scannerUnit = pd.concat((tokenizer, addingOperator, multiplyingOperator, factorOperator, relationalOperator))
-
-# tokenCode = pd.concat((tokenizer, reserved, basicDeclarationHandles, statementHandles, addingOperator, multiplyingOperator, factorOperator, relationalOperator)).unique()
+	))
 
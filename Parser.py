@@ -13,6 +13,34 @@ class Parser:
 	the parser halts execution upon encountering
 	the first syntax error in a source program.
 	"""
+
+	# these tokens always appear at the end of a line
+	lineTerminatingTokens = frozenset((Token.IS, Token.LOOP, Token.SEMICOLON, Token.BEGIN, Token.THEN, Token.ELSE))
+
+	# operator code -> evaluation lambda, built once so the expression
+	# productions do not rebuild a dict on every operator token
+	relationalOperations = {
+		Token.EQ : (lambda lhs, rhs : lhs == rhs),
+		Token.NE : (lambda lhs, rhs : lhs != rhs),
+		Token.LT : (lambda lhs, rhs : lhs < rhs),
+		Token.LE : (lambda lhs, rhs : lhs <= rhs),
+		Token.GT : (lambda lhs, rhs : lhs > rhs),
+		Token.GE : (lambda lhs, rhs : lhs >= rhs)
+	}
+	addingOperations = {
+		Token.PLUS : (lambda lhs, rhs : lhs + rhs),
+		Token.MINUS : (lambda lhs, rhs : lhs - rhs)
+	}
+	multiplyingOperations = {
+		Token.MUL : (lambda lhs, rhs : lhs * rhs),
+		Token.DIV : (lambda lhs, rhs : lhs // rhs),
+		Token.MOD : (lambda lhs, rhs : lhs % rhs)
+	}
+	unarySigns = {
+		Token.PLUS : 1,
+		Token.MINUS : -1
+	}
+
 	def __init__(self, chario, scanner):
 		"""
 		construct a Parser instance
@@ -38,14 +66,41 @@ class Parser:
 		self.table.enterSymbol("TRUE", SymbolEntry.CONST, True)
 		self.table.enterSymbol("FALSE", SymbolEntry.CONST, False)
 
+		# dispatch tables mapping a token code to the production to call,
+		# so one hashed lookup replaces a chain of code comparisons
+		self.basicDeclarationDispatch = {
+			Token.ID : self.numberOrObjectDeclaration,
+			Token.TYPE : self.typeDeclaration,
+			Token.PROC : self.subprogramBody
+		}
+		self.typeDefinitionDispatch = {
+			Token.PARENTHESIS_OPEN : self.enumerationTypeDefinition,
+			Token.ARRAY : self.arrayTypeDefinition,
+			Token.RANGE : self.range,
+			Token.ID : self.typeName
+		}
+		self.simpleStatementDispatch = {
+			Token.NULL : self.nullStatement,
+			Token.EXIT : self.exitStatement
+		}
+		self.compoundStatementDispatch = {
+			Token.IF : self.ifStatement,
+			Token.WHILE : self.loopStatement,
+			Token.LOOP : self.loopStatement
+		}
+		self.primaryDispatch = {
+			Token.numericalLiteral : self.literalPrimary,
+			Token.stringLiteral : self.literalPrimary,
+			Token.ID : self.namePrimary,
+			Token.PARENTHESIS_OPEN : self.parenthesizedPrimary
+		}
+
 
 	def parse(self):
 		"""
 		do parse the entire source code
 		"""
 		self.subprogramBody()
-		# accept EOF: check if extra symbols after logical end of program exist
-		#self.accept(Token.EOF)
 
 
 	def pushSymbols(self, identifierList, role=None, value=None):
@@ -75,26 +130,28 @@ class Parser:
 		ignore preceding newlines("\n") and unexpected tokens.
 		error message for unexpected token is handled in scanner class.
 		"""
-		while self.token.code in (Token.NEWLINE, Token.UET):
-			self.token = self.scanner.GetNextToken()
+		getNextToken = self.scanner.GetNextToken
+		token = self.token
+		while token.code in (Token.NEWLINE, Token.UET):
+			token = self.token = getNextToken()
 
 
 	def discard_tokens(self):
 			# give up parsing the line with an error by discarding all trailling tokens until a newline character
-			message = "trailing tokens: " + str(self.token) + " "
-			
-			if self.token.code not in (Token.NEWLINE, Token.EOF):
-				self.token = self.scanner.GetNextToken()
-				while self.token.code not in (Token.NEWLINE, Token.EOF):
-					message += str(self.token) + " "
-					self.token = self.scanner.GetNextToken()
-					
-			message += "were discarded"
-			
+			discarded = [str(self.token)]
+
+			getNextToken = self.scanner.GetNextToken
+			token = self.token
+			if token.code not in (Token.NEWLINE, Token.EOF):
+				token = self.token = getNextToken()
+				while token.code not in (Token.NEWLINE, Token.EOF):
+					discarded.append(str(token))
+					token = self.token = getNextToken()
+
 			# prepare next token other than newline for next parsing attempt
 			self.ignore_newlines()
 
-			print(message)
+			print("trailing tokens: " + " ".join(discarded) + " were discarded")
 
 	
 	def calculate(self, lhs, rhs, operation):
@@ -118,31 +175,35 @@ class Parser:
 
 		Arguments:
 			expected {Token.{code}} -- expected token code
-			error_message {str} -- error message if unacceptable
 		"""
-		# prepare error message first
-		error_message = "expected [" + expected + "] but " + str(self.token) + " was detected"
-
-		# these tokens always appear that the end of a line
-		line_terminating_tokens = (Token.IS, Token.LOOP, Token.SEMICOLON, Token.BEGIN, Token.THEN, Token.ELSE)
+		# remember the token seen on entry: error messages report it
+		# even if newlines are skipped before the mismatch is found
+		token = self.token
+		isLineTerminating = expected in self.lineTerminatingTokens
 
 		# if the last token of this line was an unexpected one,
 		# do not remove that newline to preserve the next line's tokens
 		# (if we do ignore it, all the tokens in the next line will be discarded!)
-		if self.token.code == Token.NEWLINE and expected in line_terminating_tokens:
-			self.fatalError(error_message)
-		
-		self.ignore_newlines()
-
-		if self.token.code != expected:
-
+		if token.code == Token.NEWLINE and isLineTerminating:
+			self.fatalError("expected [" + expected + "] but " + str(token) + " was detected")
+
+		# skip newlines and unexpected tokens, entering the loop only
+		# when there actually is something to skip; in the common case
+		# this is a single inlined membership test
+		getNextToken = self.scanner.GetNextToken
+		current = token
+		while current.code in (Token.NEWLINE, Token.UET):
+			current = self.token = getNextToken()
+
+		if current.code != expected:
 			# raise error!
-			self.fatalError(error_message)
+			self.fatalError("expected [" + expected + "] but " + str(token) + " was detected")
 		# print("hahahoho")
 
-		self.token = self.scanner.GetNextToken()
-		if expected in line_terminating_tokens:
-			self.ignore_newlines()
+		current = self.token = getNextToken()
+		if isLineTerminating:
+			while current.code in (Token.NEWLINE, Token.UET):
+				current = self.token = getNextToken()
 
 
 	def acceptRole(self, identifier, expected):
@@ -244,12 +305,9 @@ class Parser:
 		"""
 		check which declaration the token is and call declaration function
 		"""
-		if self.token.code == Token.ID:
-			self.numberOrObjectDeclaration()
-		elif self.token.code == Token.TYPE:
-			self.typeDeclaration()
-		elif self.token.code == Token.PROC:
-			self.subprogramBody()
+		declaration = self.basicDeclarationDispatch.get(self.token.code)
+		if declaration != None:
+			declaration()
 
 
 	def numberOrObjectDeclaration(self):
@@ -296,11 +354,12 @@ class Parser:
 		identifierList = identifier { "," identifier }
 		"""
 		identifiers = []
+		getNextToken = self.scanner.GetNextToken
 
 		identifiers.append(self.token.value)
 		self.accept(Token.ID)
 		while self.token.code == Token.COMMA:
-			self.token = self.scanner.GetNextToken()
+			self.token = getNextToken()
 			identifiers.append(self.token.value)
 			self.accept(Token.ID)
 
@@ -329,23 +388,25 @@ class Parser:
 		typeDefinition = enumerationTypeDefinition | arrayTypeDefinition
  		| range | <type>name
 		"""
-		if self.token.code == Token.PARENTHESIS_OPEN:
-			self.enumerationTypeDefinition()
-		elif self.token.code == Token.ARRAY:
-			self.arrayTypeDefinition()
-		elif self.token.code == Token.RANGE:
-			self.range()
-		elif self.token.code == Token.ID:
-			# force <type>name
-			# self.acceptRole(self.token.value, SymbolEntry.TYPE)
-			entry = self.name()
-			if entry != None and entry.role != SymbolEntry.TYPE:
-				self.chario.PrintErrorMessage(entry.name + ": expected " + SymbolEntry.TYPE + " identifier, not " + entry.role)
+		definition = self.typeDefinitionDispatch.get(self.token.code)
+		if definition != None:
+			definition()
 		else:
 			self.fatalError("expected either an opening parenthesis, an array,"+\
 			" a range, or an identifier but " + str(self.token) + " was detected")
 
 
+	def typeName(self):
+		"""
+		check the statement is in the same format as the EBNF of Tinyada,
+
+		force <type>name
+		"""
+		entry = self.name()
+		if entry != None and entry.role != SymbolEntry.TYPE:
+			self.chario.PrintErrorMessage(entry.name + ": expected " + SymbolEntry.TYPE + " identifier, not " + entry.role)
+
+
 	def range(self):
 		"""
 		check the statement is in the same format as the EBNF of Tinyada,
@@ -371,11 +432,7 @@ class Parser:
 		if self.token.code == Token.RANGE:
 			self.range()
 		elif self.token.code == Token.ID:
-			# force <type>name
-			# self.acceptRole(self.token.value, SymbolEntry.TYPE)
-			entry = self.name()
-			if entry != None and entry.role != SymbolEntry.TYPE:
-				self.chario.PrintErrorMessage(entry.name + ": expected " + SymbolEntry.TYPE + " identifier, not " + entry.role)
+			self.typeName()
 		else:
 			self.fatalError("error in indexing")
 
@@ -398,19 +455,16 @@ class Parser:
 		
 		arrayTypeDefinition = "array" "(" index { "," index } ")" "of" <type>name
 		"""
+		getNextToken = self.scanner.GetNextToken
 		self.accept(Token.ARRAY)
 		self.accept(Token.PARENTHESIS_OPEN)
 		self.index()
 		while self.token.code == Token.COMMA:
-			self.token = self.scanner.GetNextToken()
+			self.token = getNextToken()
 			self.index()
 		self.accept(Token.PARENTHESIS_CLOSE)
 		self.accept(Token.OF)
-		# force <type>name
-		# self.acceptRole(self.token.value, SymbolEntry.TYPE)
-		entry = self.name()
-		if entry != None and entry.role != SymbolEntry.TYPE:
-			self.chario.PrintErrorMessage(entry.name + ": expected " + SymbolEntry.TYPE + " identifier, not " + entry.role)
+		self.typeName()
 
 
 	def subprogramSpecification(self):
@@ -448,10 +502,11 @@ class Parser:
 		
 		formalPart = "(" parameterSpecification { ";" parameterSpecification } ")"
 		"""
+		getNextToken = self.scanner.GetNextToken
 		self.accept(Token.PARENTHESIS_OPEN)
 		self.parameterSpecification()
 		while self.token.code == Token.SEMICOLON:
-			self.token = self.scanner.GetNextToken()
+			self.token = getNextToken()
 			self.parameterSpecification()
 		self.accept(Token.PARENTHESIS_CLOSE)
 
@@ -467,11 +522,7 @@ class Parser:
 
 		self.accept(Token.COLON)
 		self.mode()
-		# force <type>name
-		# self.acceptRole(self.token.value, SymbolEntry.TYPE)
-		entry = self.name()
-		if entry != None and entry.role != SymbolEntry.TYPE:
-			self.chario.PrintErrorMessage(entry.name + ": expected " + SymbolEntry.TYPE + " identifier, not " + entry.role)
+		self.typeName()
 
 
 	def mode(self):
@@ -480,10 +531,11 @@ class Parser:
 		
 		mode = [ "in" ] | "in" "out" | "out"
 		"""
+		getNextToken = self.scanner.GetNextToken
 		if self.token.code == Token.IN:
-			self.token = self.scanner.GetNextToken()
+			self.token = getNextToken()
 		if self.token.code == Token.OUT:
-			self.token = self.scanner.GetNextToken()
+			self.token = getNextToken()
 
 
 	def sequenceOfStatements(self):
@@ -519,12 +571,8 @@ class Parser:
 		simpleStatement = nullStatement | assignmentStatement
 				 | procedureCallStatement | exitStatement
 		"""
-		if self.token.code == Token.NULL:
-			self.nullStatement()
-		elif self.token.code == Token.EXIT:
-			self.exitStatement()
-		else:
-			self.nameStatement()	# TODO: resolve comment: own method
+		statement = self.simpleStatementDispatch.get(self.token.code, self.nameStatement)
+		statement()
 
 
 	def nameStatement(self):
@@ -563,10 +611,8 @@ class Parser:
 		
 		compoundStatement = ifStatement | loopStatement
 		"""
-		if self.token.code == Token.IF:
-			self.ifStatement()
-		else:
-			self.loopStatement()
+		statement = self.compoundStatementDispatch.get(self.token.code, self.loopStatement)
+		statement()
 
 
 	def nullStatement(self):
@@ -701,13 +747,14 @@ class Parser:
 		
 		actualParameterPart = "(" expression { "," expression } ")"
 		"""
+		getNextToken = self.scanner.GetNextToken
 		self.accept(Token.PARENTHESIS_OPEN)
 		ret = []
 		# input("t")
 		ret.append(self.expression())
 		# input("t")
 		while self.token.code == Token.COMMA:
-			self.token = self.scanner.GetNextToken()
+			self.token = getNextToken()
 			ret.append(self.expression())
 		self.accept(Token.PARENTHESIS_CLOSE)
 		return ret
@@ -728,15 +775,17 @@ class Parser:
 		
 		expression = relation { "and" relation } | { "or" relation }
 		"""
+		getNextToken = self.scanner.GetNextToken
 		value = self.relation()
-		if self.token.code == Token.AND:
+		code = self.token.code
+		if code == Token.AND:
 			while self.token.code == Token.AND:
-				self.token = self.scanner.GetNextToken()
+				self.token = getNextToken()
 				operand = self.relation()
 				value = self.calculate(value, operand, (lambda lhs, rhs : lhs and rhs))
-		elif self.token.code == Token.OR:
+		elif code == Token.OR:
 			while self.token.code == Token.OR:
-				self.token = self.scanner.GetNextToken()
+				self.token = getNextToken()
 				operand = self.relation()
 				value = self.calculate(value, operand, (lambda lhs, rhs : lhs or rhs))
 
@@ -751,15 +800,9 @@ class Parser:
 		relation = simpleExpression [ relationalOperator simpleExpression ]
 		"""
 		value = self.simpleExpression()
-		if self.token.code in Token.relationalOperator:
-			operation = {
-				Token.EQ : (lambda lhs, rhs : lhs == rhs),
-				Token.NE : (lambda lhs, rhs : lhs != rhs),
-				Token.LT : (lambda lhs, rhs : lhs < rhs),
-				Token.LE : (lambda lhs, rhs : lhs <= rhs),
-				Token.GT : (lambda lhs, rhs : lhs > rhs),
-				Token.GE : (lambda lhs, rhs : lhs >= rhs)
-			}[self.token.code]
+		code = self.token.code
+		if code in Token.relationalOperator:
+			operation = self.relationalOperations[code]
 
 			self.token = self.scanner.GetNextToken()
 			operand = self.simpleExpression()
@@ -775,26 +818,24 @@ class Parser:
 		simpleExpression =
 				[ unaryAddingOperator ] term { binaryAddingOperator term }
 		"""
+		getNextToken = self.scanner.GetNextToken
 		sign = None
-		if self.token.code in Token.addingOperator:
-			sign = {
-				Token.PLUS : 1,
-				Token.MINUS : -1
-			}[self.token.code]
-			self.token = self.scanner.GetNextToken()
+		code = self.token.code
+		if code in Token.addingOperator:
+			sign = self.unarySigns[code]
+			self.token = getNextToken()
 
 		value = self.term()
 		if sign != None:
 			value = self.calculate(value, sign, lambda lhs, rhs : lhs * rhs)
 
-		while self.token.code in Token.addingOperator:
-			operation = {
-				Token.PLUS : (lambda lhs, rhs : lhs + rhs),
-				Token.MINUS : (lambda lhs, rhs : lhs - rhs)
-			}[self.token.code]
+		code = self.token.code
+		while code in Token.addingOperator:
+			operation = self.addingOperations[code]
 
-			self.token = self.scanner.GetNextToken()
+			self.token = getNextToken()
 			operand = self.term()
+			code = self.token.code
 			value = self.calculate(value, operand, operation)
 
 		return value
@@ -806,17 +847,16 @@ class Parser:
 		
 		term = factor { multiplyingOperator factor }
 		"""
+		getNextToken = self.scanner.GetNextToken
 		value = self.factor()
-		while self.token.code in Token.multiplyingOperator:
-			operation = {
-				Token.MUL : (lambda lhs, rhs : lhs * rhs),
-				Token.DIV : (lambda lhs, rhs : lhs // rhs),
-				Token.MOD : (lambda lhs, rhs : lhs % rhs)
-			}[self.token.code]
+		code = self.token.code
+		while code in Token.multiplyingOperator:
+			operation = self.multiplyingOperations[code]
 
-			self.token = self.scanner.GetNextToken()
+			self.token = getNextToken()
 			operand = self.factor()
 			value = self.calculate(value, operand, operation)
+			code = self.token.code
 		
 		return value
 
@@ -849,30 +889,42 @@ class Parser:
 		
 		primary = numericLiteral | stringLiteral | name | "(" expression ")"
 		"""
-		value = None
-		if self.token.code in (Token.numericalLiteral, Token.stringLiteral):
-			value = self.token.value
-			if self.token.code is Token.numericalLiteral:
-				value = int(value)
-			self.token = self.scanner.GetNextToken()
-			# print(" T: literal", value)
-		elif self.token.code == Token.ID:
-			# print(self.token.value, "open")
-			entry = self.name()
-			# print(self.token.value, "close")
-
-			if entry != None:
-				value = entry.value
-				# print(" T: identifier", value)
-			
-		elif self.token.code == Token.PARENTHESIS_OPEN:
-			self.token = self.scanner.GetNextToken()
-			value = self.expression()
-			self.accept(Token.PARENTHESIS_CLOSE)
-		else:
-			self.fatalError("expected either a numeric literal, an identifier, or an opening parenthesis but " + 
+		handler = self.primaryDispatch.get(self.token.code)
+		if handler == None:
+			self.fatalError("expected either a numeric literal, an identifier, or an opening parenthesis but " +
 				str(self.token) + " was detected")
 
+		return handler()
+
+
+	def literalPrimary(self):
+		"""
+		scan a numeric or string literal primary and return its value
+		"""
+		value = self.token.value
+		if self.token.code is Token.numericalLiteral:
+			value = int(value)
+		self.token = self.scanner.GetNextToken()
+		return value
+
+
+	def namePrimary(self):
+		"""
+		scan a name primary and return the value of its symbol table entry
+		"""
+		entry = self.name()
+		if entry != None:
+			return entry.value
+		return None
+
+
+	def parenthesizedPrimary(self):
+		"""
+		scan a parenthesized expression primary and return its value
+		"""
+		self.token = self.scanner.GetNextToken()
+		value = self.expression()
+		self.accept(Token.PARENTHESIS_CLOSE)
 		return value
 
 
@@ -897,10 +949,11 @@ class Parser:
 		
 		indexedComponent = "(" expression { "," expression } ")"
 		"""
+		getNextToken = self.scanner.GetNextToken
 		self.accept(Token.PARENTHESIS_OPEN)
 		self.expression()
 		while self.token.code == Token.COMMA:
-			self.token = self.scanner.GetNextToken()
+			self.token = getNextToken()
 			self.expression()
 		self.accept(Token.PARENTHESIS_CLOSE)
 
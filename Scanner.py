@@ -1,8 +1,41 @@
+import re
+import sys
+
 from Const import Const
 from Token import Token
 from Chario import Chario
 
 
+# single alternation that recognizes every lexical unit of TinyAda.
+# scanning the whole source with one compiled pattern keeps the
+# character-level work inside the C regex engine instead of running
+# a Python-level loop per character.
+# the source is lower-cased by Chario before it reaches the pattern.
+_TOKEN_RE = re.compile(
+	r"(?P<string>\"[^\"\n]*\")"
+	r"|(?P<integer>\d+)"
+	r"|(?P<alphabetic>[a-z][a-z0-9_]*)"
+	r"|(?P<operator>\.\.|:=|/=|<=|>=|\*\*|[+\-;(),=*/:<>])"
+	r"|(?P<newline>\n)"
+	r"|(?P<ignored>[ \r\t]+)"
+	r"|(?P<unexpected>.)"
+)
+
+
+# every token without a value belongs to a closed vocabulary: the
+# reserved words, the operator symbols and the newline. One shared Token
+# per code is built here once, so handing out such a token is a dict
+# probe instead of an allocation. Sharing is safe because tokens are
+# never mutated after construction.
+_SHARED_TOKENS = {code : Token(code, None) for code in Const.reservedWords | frozenset((
+	Const.PLUS, Const.MINUS, Const.MUL, Const.DIV, Const.SQUARE,
+	Const.EQ, Const.NE, Const.LT, Const.LE, Const.GT, Const.GE,
+	Const.COMMA, Const.COLON, Const.SEMICOLON, Const.DOT_DOT,
+	Const.PARENTHESIS_OPEN, Const.PARENTHESIS_CLOSE, Const.COLON_EQ,
+	Const.NEWLINE
+))}
+
+
 class Scanner:
 	"""
 	The Scanner class recognizes and generates tokens
@@ -11,115 +44,71 @@ class Scanner:
 	"""
 	def __init__(self, chario):
 		self.chario = chario
+		# the token stream is stored structure-of-arrays style: one list
+		# of codes and one of values, filled by a single pass up front.
+		# Token objects are only materialized when a token is handed out.
+		self._codes = []
+		self._values = []
+		self._Tokenize(chario.ReadAll())
+		self._index = 0
+		self._eofToken = Token(Const.EOF, None)
 
 
-	def StringToken(self):
-		"""
-		Scans a string literal surrounded by \", e.g. "hahahoho"
+	def _Tokenize(self, source):
 		"""
-		# remove first \"
-		self.chario.GetNextChar()
-
-		result = ""
-		while self.chario.PeekNextChar() != "\"":
-			result += self.chario.GetNextChar()
-
-		# remove last \"
-		self.chario.GetNextChar()
-		return Token(Const.stringLiteral, result)
-
-
-	def IntegerToken(self):
-		"""
-		Scans an integer value, which is a series of digits
-		"""
-		result = ""
-		while self.chario.PeekNextChar().isdigit():
-			result += self.chario.GetNextChar()
-
-		return Token(Const.numericalLiteral, result)
-
-
-	def AlphabeticToken(self):
+		Run the token pattern over the whole source buffer and fill the
+		parallel code/value lists. Ignored characters are skipped,
+		reserved words are told apart from identifiers, and an
+		unexpected symbol yields an error message and an unexpectedToken.
 		"""
-		Scans either an identifier(e.g. variable name) or a reserved word(e.g. is, null).
-		"""
-		# list of characters that cannot exist right after an identifier or a reserved word
-		delimiters = (" ", "\n", "\r", "\t", "\\", ",", ":", "<", ">", "=", ";", "+", "-", "*", "/", "(", ")", "EOF")
-
-		# scan the token
-		result = ""
-		while self.chario.PeekNextChar() not in delimiters:
-			result += self.chario.GetNextChar()
-
-		# return the result as either reserved word itself or an identifier
-		if result in Const.reservedWords:
-			return Token(result, None)
-		else:
-			return Token(Const.ID, result)
-
-
-	def OperatorToken(self):
-		"""
-		Scans an operator symbol from chario(e.g. +, :=).
-		If an unexpected character is detected, RuntimeError will be raised.
-		"""
-		singleCharOperators = ("+", "-", ";", "(", ")", ",", "=")
-		possiblyDoubleCharOperators = ("/", ":", ">", "<", "*")
-		doubleCharOperators = ("/=", ":=", "<=", ">=", "**")
-
-		# look for ".." first
-		firstChar = self.chario.GetNextChar()
-		if firstChar == "." and self.chario.PeekNextChar() == ".":
-			self.chario.GetNextChar()
-			return Token(Const.DOT_DOT, None)
-
-		# then look for definitely single character operators(e.g. +)
-		if firstChar in singleCharOperators:
-			return Token(firstChar, None)
-		else:
-			# if not, check if the character is possibly a double character operator
-			# (which is also a valid one by itself, e.g. *)
-			if firstChar in possiblyDoubleCharOperators:
-				candidate = firstChar + self.chario.PeekNextChar()
-				# check if the next character also contributes on making a double character operator(e.g. **)
-				if candidate in doubleCharOperators:
-					return Token(firstChar + self.chario.GetNextChar(), None)
+		codes = self._codes
+		values = self._values
+		for match in _TOKEN_RE.finditer(source):
+			kind = match.lastgroup
+			if kind == "ignored":
+				continue
+			elif kind == "newline":
+				codes.append(Const.NEWLINE)
+				values.append(None)
+			elif kind == "alphabetic":
+				# either a reserved word itself or an identifier.
+				# codes cut out of the source are interned so they are
+				# the same objects as the constants in Const
+				result = match.group()
+				if result in Const.reservedWords:
+					codes.append(sys.intern(result))
+					values.append(None)
 				else:
-					return Token(firstChar, None)
-			# if none of the above were the case, then its a unexpected symbol
+					codes.append(Const.ID)
+					values.append(result)
+			elif kind == "integer":
+				codes.append(Const.numericalLiteral)
+				values.append(match.group())
+			elif kind == "string":
+				# remove the surrounding double quotes
+				codes.append(Const.stringLiteral)
+				values.append(match.group()[1:-1])
+			elif kind == "operator":
+				# operator codes are the operator strings themselves
+				codes.append(sys.intern(match.group()))
+				values.append(None)
 			else:
-				self.chario.PrintErrorMessage("Unexpected symbol '" + firstChar + "' was scanned")
-				return Token(Const.UET, firstChar)
+				self.chario.PrintErrorMessage("Unexpected symbol '" + match.group() + "' was scanned")
+				codes.append(Const.UET)
+				values.append(match.group())
 
 
 	def GetNextToken(self):
 		"""
-		Read characters from chario and return the first token found
+		Return the next token of the pre-scanned stream as a Token.
+		Once the stream runs out, every call returns an EOF token.
 		"""
-		# remove ignored characters
-		ignoredCharacters = (" ", "\r", "\t")
-		while True:
-			nextChar = self.chario.PeekNextChar()
-			if nextChar == "EOF":
-				return Token(Const.EOF, None)
-
-			if nextChar in ignoredCharacters:
-				self.chario.GetNextChar()
-			else:
-				break
-
-		# check the type of this token.
-		# this scanner assumes that all identifiers start with an alphabet.
-		nextChar = self.chario.PeekNextChar()
-		if nextChar == Const.NEWLINE:
-			self.chario.GetNextChar()
-			return Token(Const.NEWLINE, None)
-		elif nextChar == "\"":
-			return self.StringToken()
-		elif nextChar.isalpha():
-			return self.AlphabeticToken()
-		elif nextChar.isdigit():
-			return self.IntegerToken()
-		else:
-			return self.OperatorToken()
+		index = self._index
+		if index < len(self._codes):
+			self._index = index + 1
+			value = self._values[index]
+			if value is None:
+				return _SHARED_TOKENS[self._codes[index]]
+			return Token(self._codes[index], value)
+
+		return self._eofToken
@@ -12,6 +12,10 @@ class Token(Const):
 	and a data type, as we will see in later chapters.
 	"""
 
+	# one Token is allocated per lexical unit of the source,
+	# so skip the per-instance __dict__ and store the two fields inline
+	__slots__ = ("code", "value")
+
 	def __init__(self, code, value):
 		self.code = code
 		self.value = value